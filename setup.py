@@ -16,7 +16,6 @@ setup(
         "matplotlib",
         "mpld3",
         "shapely==1.8.0",
-        "sympy",
         "numpy",
         "screeninfo",
         "tqdm",
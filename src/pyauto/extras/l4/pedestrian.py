@@ -1,7 +1,6 @@
 import math
 import random
 
-import sympy
 import owlready2
 
 from shapely.geometry import Polygon
@@ -72,20 +71,21 @@ with l4_core:
                 else:
                     walkway = spawn_walkway
                 left, right, front, back = extras.utils.split_polygon_into_boundaries(walkway.get_geometry())
-                medium = sympy.Segment(*front.centroid.coords, *back.centroid.coords)
-                x = sympy.Symbol("x")
                 if offset is None:
                     rel_offset = 0.2
                 else:
                     rel_offset = offset / walkway.has_length
                 pos = self.namespace.world._random.uniform(0 + rel_offset, 1 - rel_offset)
-                spawn_point = medium.arbitrary_point(x).subs({x: pos})
-                null_line = sympy.Ray((0, 0), (1, 0))
-                yaw = (360 - math.degrees(
-                    null_line.closing_angle(sympy.Ray(*front.centroid.coords, *back.centroid.coords)))) % 360
+                # Spawns on the medium of the walkway, i.e., the segment between the centroids of front and back,
+                # facing back
+                f = front.centroid
+                b = back.centroid
+                spawn_x = f.x + pos * (b.x - f.x)
+                spawn_y = f.y + pos * (b.y - f.y)
+                yaw = math.degrees(math.atan2(b.y - f.y, b.x - f.x)) % 360
                 if self.namespace.world._random.random() < 0.5:
                     yaw = (yaw + 180) % 360
-                self.set_geometry(spawn_point.x, spawn_point.y, length=length, width=width, rotate=yaw)
+                self.set_geometry(spawn_x, spawn_y, length=length, width=width, rotate=yaw)
                 pos_taken = False
                 others = list(
                     self.namespace.world.search(
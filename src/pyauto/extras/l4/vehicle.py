@@ -2,7 +2,6 @@ import math
 
 import numpy
 import owlready2
-import sympy
 
 from shapely.geometry import Polygon
 from owlready2_augmentator import augment, augment_class, AugmentationType
@@ -128,20 +127,21 @@ with l4_core:
                 else:
                     lane = spawn_lane
                 left, right, front, back = extras.utils.split_polygon_into_boundaries(lane.get_geometry())
-                medium = sympy.Segment(*front.centroid.coords, *back.centroid.coords)
-                x = sympy.Symbol("x")
                 if offset is None:
                     rel_offset = 0.2
                 else:
                     rel_offset = offset / lane.has_length
                 pos = self.namespace.world._random.uniform(0 + rel_offset, 1 - rel_offset)
-                spawn_point = medium.arbitrary_point(x).subs({x: pos})
-                null_line = sympy.Ray((0, 0), (1, 0))
-                yaw = (360 - math.degrees(
-                    null_line.closing_angle(sympy.Ray(*front.centroid.coords, *back.centroid.coords)))) % 360
+                # Spawns on the medium of the lane, i.e., the segment between the centroids of front and back,
+                # facing back
+                f = front.centroid
+                b = back.centroid
+                spawn_x = f.x + pos * (b.x - f.x)
+                spawn_y = f.y + pos * (b.y - f.y)
+                yaw = math.degrees(math.atan2(b.y - f.y, b.x - f.x)) % 360
                 if len(lane.has_successor_lane) == 0:
                     yaw = (yaw + 180) % 360
-                self.set_geometry(spawn_point.x, spawn_point.y, width=width, length=length, rotate=(yaw))
+                self.set_geometry(spawn_x, spawn_y, width=width, length=length, rotate=(yaw))
                 pos_taken = False
                 for other in self.namespace.world.search(
                         type=self.namespace.world.get_ontology(auto.Ontology.L4_Core.value).Vehicle):
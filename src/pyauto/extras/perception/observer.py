@@ -8,6 +8,7 @@ from shapely import wkt
 from owlready2_augmentator import augment, augment_class, AugmentationType
 
 from ... import auto
+from .. import utils
 
 _DEFAULT_VISIBILITY = 50  # m, the visibility that is assumed if the observer does not have a specific visibility given
 _OCCLUSION_SAMPLING_STEP = 0.25  # °, the step size that is used to sample the circular segment for occluded areas
@@ -145,8 +146,8 @@ with perception:
                 if len(self.drives) > 0:
                     length = numpy.linalg.norm(numpy.array(self.drives[0].get_left_back_point()) -
                                                numpy.array(self.drives[0].get_left_front_point())) / 4
-                    head = (self_geom.centroid.x + math.cos(math.radians(yaw)) * length,
-                            self_geom.centroid.y + math.sin(math.radians(yaw)) * length)
+                    cos_yaw, sin_yaw = utils.get_yaw_vector(yaw)
+                    head = (self_geom.centroid.x + cos_yaw * length, self_geom.centroid.y + sin_yaw * length)
                 else:
                     head = (self_geom.centroid.x, self_geom.centroid.y)
                 visibility = self.has_visibility_range or _DEFAULT_VISIBILITY
@@ -3,11 +3,10 @@ import logging
 from typing import Tuple, Any
 
 import numpy
-import sympy
 import owlready2
 
 from functools import cache
-from shapely import wkt, geometry, affinity
+from shapely import geometry, affinity, ops, prepared
 from owlready2_augmentator import augment, augment_class, AugmentationType
 
 from ... import auto
@@ -16,6 +15,52 @@ from .spatial_object import _SPATIAL_PREDICATE_THRESHOLD
 
 logger = logging.getLogger(__name__)
 
+
+def _roll_out(x: float, y: float, yaw: float, yaw_rate: float, speed: float, length: float, delta_t: float,
+              steps: int) -> numpy.ndarray:
+    """
+    Kernel of the constant velocity, constant yaw rate prediction model. In each step, the object is rotated around a
+    point that is `length` behind its current centroid (e.g. the rear axle of a vehicle) and then moved along its new
+    yaw. The yaw rate is reduced linearly by 40% / s. The centroid is tracked analytically, as rotating around the
+    center moves it on a circle around the center, such that all steps are computed at once.
+    :param x: The x coordinate of the initial centroid.
+    :param y: The y coordinate of the initial centroid.
+    :param yaw: The initial yaw (degrees).
+    :param yaw_rate: The initial yaw rate (degrees / s).
+    :param speed: The (constant) speed.
+    :param length: The distance of the rotation center behind the centroid.
+    :param delta_t: The time delta between two steps.
+    :param steps: The number of steps to predict.
+    :returns: A (steps, 6) array of affine transformation matrices [a, b, d, e, xoff, yoff] that map the initial
+        geometry to the predicted geometry of each step.
+    """
+    cos_yaw, sin_yaw = utils.get_yaw_vector(yaw)
+    if yaw_rate == 0:
+        # Straight motion along the initial yaw, i.e., only translations
+        distances = speed * delta_t * numpy.arange(1, steps + 1)
+        matrices = numpy.zeros((steps, 6))
+        matrices[:, 0] = 1
+        matrices[:, 3] = 1
+        matrices[:, 4] = cos_yaw * distances
+        matrices[:, 5] = sin_yaw * distances
+        return matrices
+    # The yaw rate is reduced by a constant factor in each step, therefore yaws and centroids are cumulative sums.
+    # Angles are handled in radians internally to avoid converting them over and over again.
+    yaw_rates = math.radians(yaw_rate) * (1 - (0.4 * delta_t)) ** numpy.arange(steps)
+    yaws = math.radians(yaw) + numpy.cumsum(yaw_rates * delta_t)
+    cos_yaws = numpy.cos(yaws)
+    sin_yaws = numpy.sin(yaws)
+    c_x = x + length * (cos_yaws - cos_yaw) + numpy.cumsum(cos_yaws * speed * delta_t)
+    c_y = y + length * (sin_yaws - sin_yaw) + numpy.cumsum(sin_yaws * speed * delta_t)
+    # Rotation by the total yaw change around the initial centroid, followed by a translation to the new centroid. The
+    # cosine and sine of the yaw change follow from the angle difference identities without further trigonometry.
+    cos_a = cos_yaws * cos_yaw + sin_yaws * sin_yaw
+    sin_a = sin_yaws * cos_yaw - cos_yaws * sin_yaw
+    matrices = numpy.stack([cos_a, -sin_a, sin_a, cos_a, c_x - cos_a * x + sin_a * y, c_y - sin_a * x - cos_a * y],
+                           axis=1)
+    return matrices
+
+
 physics = auto.world.get_ontology(auto.Ontology.Physics.value)
 geosparql = auto.world.get_ontology(auto.Ontology.GeoSPARQL.value)
 
@@ -63,11 +108,10 @@ with physics:
             else:
                 v = [x for x in [self.has_velocity_x, self.has_velocity_y, self.has_velocity_z] if x is not None]
                 if len(v) > 1:
-                    angle = math.degrees(math.atan2(v[1], v[0])) % 360
-                    sign = 1
-                    if 90 < angle < 270:
-                        sign = -1
-                    return float(sign * numpy.linalg.norm(v))
+                    # The velocity points backwards (i.e., its angle is in (90°, 270°)) iff. its x component is
+                    # negative
+                    speed = math.hypot(*v)
+                    return -speed if v[0] < 0 else speed
 
         @augment(AugmentationType.DATA_PROPERTY, "has_yaw")
         def get_yaw(self) -> float:
@@ -92,11 +136,9 @@ with physics:
                 a = [x for x in [self.has_acceleration_x, self.has_acceleration_y, self.has_acceleration_z]
                      if x is not None]
                 if len(a) > 1:
-                    angle = math.degrees(math.atan2(a[1], a[0])) % 360
-                    sign = 1
-                    if 90 < angle < 270:
-                        sign = -1
-                    return float(sign * numpy.linalg.norm(a))
+                    # The acceleration points backwards iff. its x component is negative
+                    acceleration = math.hypot(*a)
+                    return -acceleration if a[0] < 0 else acceleration
 
         @augment(AugmentationType.REIFIED_DATA_PROPERTY, physics.Has_Distance_To, "distance_from", "distance_to",
                  "has_distance")
@@ -107,10 +149,10 @@ with physics:
             :param other: The spatial object to measure distance to.
             """
             if self != other and self.has_geometry() and other.has_geometry():
-                p1 = wkt.loads(self.hasGeometry[0].asWKT[0])
-                p2 = wkt.loads(other.hasGeometry[0].asWKT[0])
-                distance = float(p1.distance(p2))
-                if distance <= _SPATIAL_PREDICATE_THRESHOLD:
+                p1 = self.get_geometry()
+                p2 = other.get_geometry()
+                distance = utils.get_distance_up_to(p1, p2, _SPATIAL_PREDICATE_THRESHOLD)
+                if distance is not None and distance <= _SPATIAL_PREDICATE_THRESHOLD:
                     return distance
 
         @augment(AugmentationType.OBJECT_PROPERTY, "has_intersecting_path")
@@ -123,8 +165,8 @@ with physics:
             if self != other and ((len(self.drives) == 0 and len(other.drives) == 0) or
                                   (len(self.drives) > 0 and other not in self.drives) or
                                   (len(other.drives) > 0 and self not in other.drives)) \
-                    and self.has_geometry() and other.has_geometry() and self.get_speed() or 0 > 0 and \
-                    other.get_speed() or 0 > 0:
+                    and self.has_geometry() and other.has_geometry() and (self.get_speed() or 0) > 0 and \
+                    (other.get_speed() or 0) > 0:
                 t_self, t_other, _ = self.intersects_path_with(other)
                 if t_self is None or t_other is None:
                     return False
@@ -139,28 +181,61 @@ with physics:
             :param other: The other moving dynamical object.
             :returns: True iff. the high relative speed condition is satisfied.
             """
-            if self != other and self.has_geometry() and other.has_geometry() and self.get_speed() or 0 > 0 and \
-                    other.get_speed() or 0 > 0 and self.has_yaw is not None and other.has_yaw is not None and \
-                    self.has_velocity_x is not None and self.has_velocity_y is not None and \
-                    other.has_velocity_x is not None and other.has_velocity_x is not None:
+            if self != other and self.has_geometry() and other.has_geometry() and (self.get_speed() or 0) > 0 and \
+                    (other.get_speed() or 0) > 0 and self.has_yaw is not None and other.has_yaw is not None:
                 # TODO this crashes in combination with TOBM
-                v_self = numpy.array(
-                    self.convert_local_to_global_vector([self.has_velocity_x, self.has_velocity_y]))
-                v_othe = numpy.array(
-                    other.convert_local_to_global_vector([other.has_velocity_x, other.has_velocity_y]))
-                s_rel = numpy.linalg.norm(v_self - v_othe)
-                s_self_max = max([x for y in self.is_a for x in y.has_maximum_speed])
-                if s_self_max is not None:
-                    s_self_max = self._DEFAULT_MAX_SPEED
-                if self.has_speed_limit is not None:
-                    s_rule_max = self.has_speed_limit
-                elif len(self.in_traffic_model) > 0 and self.in_traffic_model[0].has_speed_limit is not None:
-                    s_rule_max = self.in_traffic_model[0].has_speed_limit
-                else:
-                    s_rule_max = self._DEFAULT_SPEED_LIMIT
-                s_rel_normed = s_rel / (min(s_self_max, s_rule_max))
+                v_self = self.get_global_velocity()
+                v_othe = other.get_global_velocity()
+                if v_self is None or v_othe is None:
+                    return None
+                s_rel = math.hypot(v_self[0] - v_othe[0], v_self[1] - v_othe[1])
+                s_rel_normed = s_rel / (min(self.get_maximum_speed(), self.get_speed_limit()))
                 return s_rel_normed >= self._HIGH_REL_SPEED_THRESHOLD
 
+        def get_global_velocity(self) -> tuple[float, float] | None:
+            """
+            Converts the velocity of this object to the global coordinate system. The result is cached on the object
+            and recomputed only if the velocity or yaw of this object changes.
+            :returns: The global velocity vector (x, y) or None if the velocity or yaw is not given.
+            """
+            state = (self.has_velocity_x, self.has_velocity_y, self.get_yaw())
+            cached = getattr(self, "_global_velocity", None)
+            if cached is None or cached[0] != state:
+                if None in state:
+                    cached = (state, None)
+                else:
+                    cached = (state, self.convert_local_to_global_vector(state[:2]))
+                self._global_velocity = cached
+            return cached[1]
+
+        def get_maximum_speed(self) -> float:
+            """
+            The result is cached on the object and recomputed only if the classes of this object change.
+            :returns: The maximum speed of this object as given by its classes or _DEFAULT_MAX_SPEED if none is given.
+            """
+            classes = tuple(self.is_a)
+            cached = getattr(self, "_maximum_speed", None)
+            if cached is None or cached[0] != classes:
+                s_max = max((x for y in classes if hasattr(y, "has_maximum_speed") for x in y.has_maximum_speed),
+                            default=None)
+                if s_max is None:
+                    s_max = self._DEFAULT_MAX_SPEED
+                cached = (classes, s_max)
+                self._maximum_speed = cached
+            return cached[1]
+
+        def get_speed_limit(self) -> float:
+            """
+            :returns: The speed limit applying to this object, i.e., its own speed limit, the one of its traffic model,
+                or _DEFAULT_SPEED_LIMIT if none is given.
+            """
+            if self.has_speed_limit is not None:
+                return self.has_speed_limit
+            elif len(self.in_traffic_model) > 0 and self.in_traffic_model[0].has_speed_limit is not None:
+                return self.in_traffic_model[0].has_speed_limit
+            else:
+                return self._DEFAULT_SPEED_LIMIT
+
         def intersects_path_with(self, other: physics.Dynamical_Object, delta_t: float | int = 0.25,
                                  horizon: float | int = 10) -> tuple[Any | None, Any | None, Any | None]:
             """
@@ -172,110 +247,162 @@ with physics:
             :returns: The times that self and other needs and the intersection point as a triple, or None, None, None if
                 there is no intersection point.
             """
+            if self == other or not self.has_geometry() or not other.has_geometry():
+                return None, None, None
+            # The relation is symmetric, therefore each pair of dynamical objects is only computed once and cached on
+            # the object with the lower storid
+            if isinstance(other, Dynamical_Object) and other.storid < self.storid:
+                t_2, t_1, soonest_intersection = other._get_intersecting_path(self, delta_t, horizon)
+                return t_1, t_2, soonest_intersection
+            return self._get_intersecting_path(other, delta_t, horizon)
+
+        def _get_intersecting_path(self, other: physics.Dynamical_Object, delta_t: float | int,
+                                   horizon: float | int) -> tuple[Any | None, Any | None, Any | None]:
+            """
+            Returns intersects_path_with() for the given pair of objects. Results are cached on this object per other
+            object and parameters, and recomputed as soon as the state of one of both objects changes.
+            """
+            state = (self._get_prediction_state(), self.get_wkt(),
+                     other._get_prediction_state() if isinstance(other, Dynamical_Object) else None, other.get_wkt())
+            intersecting_paths = getattr(self, "_intersecting_paths", None)
+            if intersecting_paths is None:
+                intersecting_paths = self._intersecting_paths = {}
+            key = (other, delta_t, horizon)
+            if key not in intersecting_paths or intersecting_paths[key][0] != state:
+                intersecting_paths[key] = (state, self._intersects_path_with(other, delta_t, horizon))
+            return intersecting_paths[key][1]
+
+        def _intersects_path_with(self, other: physics.Dynamical_Object, delta_t: float | int,
+                                  horizon: float | int) -> tuple[Any | None, Any | None, Any | None]:
+            """
+            Computes intersects_path_with() for the given pair of objects without caching.
+            """
             soonest_intersection = None
             t_1 = None
             t_2 = None
 
-            if not hasattr(self, "intersects_path_with_cached"):
-                self.intersects_path_with_cached = {}
-            if not hasattr(other, "intersects_path_with_cached"):
-                other.intersects_path_with_cached = {}
-
-            if other not in self.intersects_path_with_cached.keys() and self != other and self.has_geometry() and \
-                    other.has_geometry():
-                p_1 = self.get_centroid()
-                p_2 = other.get_centroid()
-                if p_1 != p_2:
-                    if isinstance(self, Dynamical_Object):
-                        pred_1 = self.prediction(delta_t=delta_t, horizon=horizon)
-                    else:
-                        pred_1 = [(self.get_geometry(), i) for i in numpy.arange(delta_t, horizon + delta_t, delta_t)]
-                    if isinstance(other, Dynamical_Object):
-                        pred_2 = other.prediction(delta_t=delta_t, horizon=horizon)
-                    else:
-                        pred_2 = [(self.get_geometry(), i) for i in numpy.arange(delta_t, horizon + delta_t, delta_t)]
-                    candidates = []
-                    pred_1_union = pred_1[0][0]
-                    for g_1, _ in pred_1:
-                        pred_1_union = pred_1_union.union(g_1)
-                    pred_2_union = pred_2[0][0]
-                    for g_2, _ in pred_2:
-                        pred_2_union = pred_2_union.union(g_2)
-                    if pred_1_union.intersects(pred_2_union):
-                        for g_1, t_p_1 in pred_1:
-                            if g_1.intersects(pred_2_union):
-                                for g_2, t_p_2 in pred_2:
-                                    if t_p_1 + t_p_2 <= horizon and g_2.intersects(pred_1_union):
-                                        intersection = g_1.intersection(g_2)
-                                        if intersection.area > 0:
-                                            candidates.append((intersection.centroid, t_p_1, t_p_2))
-
-                    if len(candidates) > 0:
-                        candidates = sorted(candidates, key=lambda x: x[1] + x[2])
-                        soonest_intersection = candidates[0][0]
-                        t_1 = candidates[0][1]
-                        t_2 = candidates[0][2]
-                self.intersects_path_with_cached[other] = (t_1, t_2, soonest_intersection)
-                other.intersects_path_with_cached[self] = (t_2, t_1, soonest_intersection)
-            elif other in self.intersects_path_with_cached.keys() and \
-                    self.intersects_path_with_cached[other] is not None:
-                t_1 = self.intersects_path_with_cached[other][0]
-                t_2 = self.intersects_path_with_cached[other][1]
-                soonest_intersection = self.intersects_path_with_cached[other][2]
+            p_1 = self.get_centroid()
+            p_2 = other.get_centroid()
+            if not (math.isclose(p_1.x, p_2.x) and math.isclose(p_1.y, p_2.y)):
+                pred_1 = self.prediction(delta_t=delta_t, horizon=horizon)
+                pred_2 = other.prediction(delta_t=delta_t, horizon=horizon)
+                candidates = []
+                # Pairs within the horizon whose bounding boxes overlap, determined for all pairs at once. Objects whose
+                # predicted paths are far apart have no such pairs, and need no further (costly) geometric operations.
+                b_1 = numpy.array([g_1.bounds for g_1, _ in pred_1])
+                b_2 = numpy.array([g_2.bounds for g_2, _ in pred_2])
+                t_1s = numpy.array([t_p_1 for _, t_p_1 in pred_1])
+                t_2s = numpy.array([t_p_2 for _, t_p_2 in pred_2])
+                pairs = (t_1s[:, None] + t_2s[None, :] <= horizon) & \
+                    (b_1[:, None, 0] <= b_2[None, :, 2]) & (b_1[:, None, 2] >= b_2[None, :, 0]) & \
+                    (b_1[:, None, 1] <= b_2[None, :, 3]) & (b_1[:, None, 3] >= b_2[None, :, 1])
+                if pairs.any():
+                    pred_1_union = ops.unary_union([g_1 for g_1, _ in pred_1])
+                    pred_2_union = ops.unary_union([g_2 for g_2, _ in pred_2])
+                else:
+                    pred_1_union = pred_2_union = geometry.Polygon()
+                # Only areal geometries can have an intersection with a non-zero area
+                if pred_1_union.area > 0 and pred_2_union.area > 0 and pred_1_union.intersects(pred_2_union):
+                    # The unions are tested against many single geometries, so preparing them pays off
+                    pred_1_union_prep = prepared.prep(pred_1_union)
+                    pred_2_union_prep = prepared.prep(pred_2_union)
+                    for i in numpy.flatnonzero(pairs.any(axis=1)):
+                        g_1, t_p_1 = pred_1[i]
+                        if pred_2_union_prep.intersects(g_1):
+                            g_1_prep = prepared.prep(g_1)
+                            for j in numpy.flatnonzero(pairs[i]):
+                                g_2, t_p_2 = pred_2[j]
+                                # Interiors intersect iff. the intersection has a non-zero area, which avoids
+                                # constructing the intersection geometry for each pair
+                                if pred_1_union_prep.intersects(g_2) and g_1_prep.intersects(g_2) and \
+                                        g_1.relate_pattern(g_2, "T********"):
+                                    candidates.append((t_p_1, t_p_2, i, j))
 
+                if len(candidates) > 0:
+                    t_1, t_2, i, j = min(candidates, key=lambda x: x[0] + x[1])
+                    soonest_intersection = pred_1[i][0].intersection(pred_2[j][0]).centroid
             return t_1, t_2, soonest_intersection
 
-        @cache
         def prediction(self, delta_t: float | int = 0.1, horizon: float | int = 8):
             """
             Implementation of a sampling-based, simple constant velocity, constant yaw rate prediction model based on
-            bounding boxes.
+            bounding boxes. Predictions are cached per object and recomputed as soon as the kinematic state or the
+            geometry of this object changes.
             :param delta_t: The time delta for sampling.
             :param horizon: The time horizon (max. time that is sampled) for prediction.
             :return: A list of tuples of `shapely` geometries and time stamps, where ich geometry represents the object
                 at the given point in time.
             """
+            state = self._get_prediction_state()
+            predictions = getattr(self, "_predictions", None)
+            if predictions is None:
+                predictions = self._predictions = {}
+            if (delta_t, horizon) not in predictions or predictions[(delta_t, horizon)][0] != state:
+                predictions[(delta_t, horizon)] = (state, self._predict(delta_t, horizon))
+            return predictions[(delta_t, horizon)][1]
+
+        def _get_prediction_state(self) -> tuple:
+            """
+            :returns: The kinematic state and geometry that the predictions of this object depend on.
+            """
+            drives = self.drives
+            geo_obj = drives[0] if len(drives) > 0 else self
+            return (self.has_yaw, self.has_speed, self.has_yaw_rate, self.has_length, geo_obj.has_length,
+                    geo_obj.get_wkt())
+
+        def _predict(self, delta_t: float | int, horizon: float | int):
+            """
+            Computes prediction() without caching.
+            """
             yaw_rate = self.has_yaw_rate or 0
-            if len(self.drives) > 0:
-                geo = self.drives[0].get_geometry()
-                geo_c = self.drives[0].get_centroid()
+            yaw = self.has_yaw
+            speed = self.has_speed
+            drives = self.drives
+            if len(drives) > 0:
+                geo = drives[0].get_geometry()
+                geo_c = drives[0].get_centroid()
             else:
                 geo = self.get_geometry()
                 geo_c = self.get_centroid()
             geos = [(geo, 0)]
-            if self.has_yaw is None:
+            if yaw is None:
                 yaw = 0
                 speed = 0
+            elif speed is not None:
+                # if speed is 0, we assume object speeds up to some rather low speed
+                if "l4_de.Parking_Vehicle" not in [str(x) for x in self.is_a]:
+                    speed = max(self._RELEVANT_LOWEST_SPEED * 10, speed)
             else:
-                yaw = self.has_yaw
-                if self.has_speed is not None:
-                    # if speed is 0, we assume object speeds up to some rather low speed
-                    if "l4_de.Parking_Vehicle" not in [str(x) for x in self.is_a]:
-                        speed = max(self._RELEVANT_LOWEST_SPEED * 10, self.has_speed)
-                    else:
-                        speed = self.has_speed
-                else:
-                    speed = 0
-            for i in numpy.arange(delta_t, horizon + delta_t, delta_t):
-                prev_yaw = yaw
-                yaw = prev_yaw + yaw_rate * delta_t
-                xoff = math.cos(math.radians(yaw)) * speed * delta_t
-                yoff = math.sin(math.radians(yaw)) * speed * delta_t
-                if isinstance(geo, geometry.Polygon):
-                    length = self.has_length
-                    if not length and len(self.drives) > 0:
-                        length = self.drives[0].has_length
-                    if not length:
-                        length = 0
-                    length *= 0.4
-                    inv_yaw = math.radians(self.has_yaw + 180) % 360
-                    center = geometry.Point(geo_c.x + length * math.cos(inv_yaw), geo_c.y + length * math.sin(inv_yaw))
+                speed = 0
+            # Polygons are rotated around a point behind their centroid (e.g. the rear axle of a vehicle)
+            length = 0
+            if isinstance(geo, geometry.Polygon):
+                length = self.has_length
+                if not length and len(drives) > 0:
+                    length = drives[0].has_length
+                if not length:
+                    length = 0
+                length *= 0.4
+            timestamps = numpy.arange(delta_t, horizon + delta_t, delta_t)
+            if speed == 0 and yaw_rate == 0:
+                # Static objects keep their geometry, no need to transform it
+                return geos + [(geo, i) for i in timestamps]
+            matrices = _roll_out(geo_c.x, geo_c.y, yaw, yaw_rate, speed, length, delta_t, len(timestamps))
+            if isinstance(geo, geometry.Polygon) and not geo.has_z and len(geo.interiors) == 0:
+                # Transforms the exterior coordinates of all steps at once, which is much faster than letting shapely
+                # transform the polygon step by step
+                coords = numpy.asarray(geo.exterior.coords)
+                if yaw_rate == 0:
+                    # No rotation, therefore the coordinates are only translated
+                    coords = coords[None, :, :] + matrices[:, None, 4:]
                 else:
-                    center = geo_c
-                geo = affinity.rotate(geo, angle=yaw - prev_yaw, origin=center)
-                geo = affinity.translate(geo, xoff=xoff, yoff=yoff)
-                geos.append((geo, i))
-                yaw_rate *= 1 - (0.4 * delta_t)  # linear reduction of yaw rate (40% reduction / s) in prediction
+                    rotations = matrices[:, :4].reshape(-1, 2, 2)
+                    coords = numpy.einsum("tij,kj->tki", rotations, coords) + matrices[:, None, 4:]
+                for c, i in zip(coords, timestamps):
+                    geos.append((geometry.Polygon(c), i))
+            else:
+                for matrix, i in zip(matrices, timestamps):
+                    geos.append((affinity.affine_transform(geo, matrix), i))
             return geos
 
         def get_target_following_polygon(self, polygon: geometry.Polygon, target_distance: float | int = 5) -> \
@@ -293,14 +420,13 @@ with physics:
             # We have a driver: Choose vehicle front to determine where to look for new targets (if available)
             if len(self.drives) > 0:
                 x, y = self.drives[0].get_geometry().minimum_rotated_rectangle.exterior.coords.xy
-                edge_length = (geometry.Point(x[0], y[0]).distance(geometry.Point(x[1], y[1])),
-                               geometry.Point(x[1], y[1]).distance(geometry.Point(x[2], y[2])))
+                edge_length = (math.hypot(x[1] - x[0], y[1] - y[0]), math.hypot(x[2] - x[1], y[2] - y[1]))
                 length = max(edge_length) * 0.75
             # We have a pedestrian
             else:
                 length = 1
-            g_front = geometry.Point(g.x + math.cos(math.radians(self.has_yaw)) * length,
-                                     g.y + math.sin(math.radians(self.has_yaw)) * length)
+            yaw_x, yaw_y = utils.get_yaw_vector(self.has_yaw)
+            g_front = geometry.Point(g.x + yaw_x * length, g.y + yaw_y * length)
             p_l_f = None
             p_r_f = None
             angle = 180
@@ -316,32 +442,23 @@ with physics:
                 circ = g.buffer(target_distance)
                 intersection = circ.intersection(polygon.exterior)
                 if hasattr(intersection, "geoms"):
-                    intersection = [p for g in intersection.geoms for p in g.coords]
+                    intersection = [p[:2] for g in intersection.geoms for p in g.coords]
                 else:
-                    intersection = list(intersection.coords)
-                m_l, m_dist_l = None, None
-                for int_p in intersection:
-                    c_dist_l = p_l_f.distance(geometry.Point(int_p))
-                    if m_dist_l is None or c_dist_l < m_dist_l:
-                        m_dist_l = c_dist_l
-                        m_l = int_p
-                if m_l in intersection:
-                    intersection.remove(m_l)
-                m_r, m_dist_r = None, None
-                for int_p in intersection:
-                    c_dist_r = p_r_f.distance(geometry.Point(int_p))
-                    if m_dist_r is None or c_dist_r < m_dist_r:
-                        m_dist_r = c_dist_r
-                        m_r = int_p
-                if m_l is not None and m_r is not None:
-                    res = geometry.LineString([m_l, m_r]).centroid
-                    x = res.x
-                    y = res.y
+                    intersection = [p[:2] for p in intersection.coords]
+                # The closest point on the left can not be the closest point on the right
+                if len(intersection) > 1:
+                    intersection = numpy.array(intersection)
+                    d_l = numpy.hypot(intersection[:, 0] - p_l_f.x, intersection[:, 1] - p_l_f.y)
+                    i_l = numpy.argmin(d_l)
+                    d_r = numpy.hypot(intersection[:, 0] - p_r_f.x, intersection[:, 1] - p_r_f.y)
+                    d_r[i_l] = numpy.inf
+                    i_r = numpy.argmin(d_r)
+                    x, y = ((intersection[i_l] + intersection[i_r]) / 2).tolist()
             if x is None or y is None:
-                logger.debug(str(self) + ": Using target in front of object instead of polygon following computation "
-                                           "since no closest point on polygon could be determined")
-                x = target_distance * math.cos(math.radians(self.has_yaw)) + g.x
-                y = target_distance * math.sin(math.radians(self.has_yaw)) + g.y
+                logger.debug("%s: Using target in front of object instead of polygon following computation since no "
+                             "closest point on polygon could be determined", self)
+                x = target_distance * yaw_x + g.x
+                y = target_distance * yaw_y + g.y
             return round(x, 2), round(y, 2)
 
         def is_intersection_possible(self, other, max_distance: int | float = 10):
@@ -349,17 +466,22 @@ with physics:
             Checks whether an intersection is possible with the given other individual, i.e., an over-approximation
             to prevent computations later on.
             """
+            self_speed = self.has_speed
+            other_speed = other.has_speed
+            # Excludes drivers (we handle their vehicles instead) - checked before computing the (costly) distance
+            if other == self or other in self.drives or not other.has_height or other.has_height <= 0 or \
+                    (hasattr(other, "drives") and len(other.drives) > 0) or (not self_speed and not other_speed):
+                return False
             if hasattr(self, "drives") and len(self.drives) > 0:
                 dist = other.get_distance(self.drives[0])
             else:
                 dist = other.get_distance(self)
-            # Excludes drivers (we handle their vehicles instead)
-            return other != self and other not in self.drives and other.has_height and other.has_height > 0 and \
-                (not hasattr(other, "drives") or len(other.drives) == 0) and \
-                ((other.has_speed and self.has_speed and (dist / self.has_speed + dist / other.has_speed)
-                  <= max_distance) or
-                 (not other.has_speed and self.has_speed and (dist / self.has_speed) <= max_distance) or
-                 (not self.has_speed and other.has_speed and (dist / other.has_speed) <= max_distance))
+            if self_speed and other_speed:
+                return dist / self_speed + dist / other_speed <= max_distance
+            elif self_speed:
+                return dist / self_speed <= max_distance
+            else:
+                return dist / other_speed <= max_distance
 
         @cache
         def get_intersecting_objects(self, horizon=10, delta_t=0.25) -> list:
@@ -367,13 +489,23 @@ with physics:
             :returns: a list of tuples of intersecting, spatial objects and their intersecting paths.
             """
             res = []
-            for obj in self.namespace.world.search(
-                    type=self.namespace.world.get_ontology(auto.Ontology.Physics.value).Spatial_Object):
+            if hasattr(self, "drives") and len(self.drives) > 0:
+                self_obj = self.drives[0]
+            else:
+                self_obj = self
+            objs = list(self.namespace.world.search(
+                type=self.namespace.world.get_ontology(auto.Ontology.Physics.value).Spatial_Object))
+            # An intersection is only possible if the other object can be reached within the horizon at the highest
+            # speed of all objects, which allows to filter objects by their bounding boxes only (for negative speeds,
+            # this over-approximation does not hold)
+            speeds = [x.has_speed for x in objs if x.has_speed is not None] + [self.has_speed or 0]
+            if self_obj.has_geometry() and min(speeds) >= 0:
+                max_distance = horizon * max(speeds)
+                bounds = self_obj.get_geometry().bounds
+                objs = [x for x in objs if not x.has_geometry() or
+                        utils.get_bounds_distance(bounds, x.get_geometry().bounds) <= max_distance]
+            for obj in objs:
                 if self.is_intersection_possible(obj, max_distance=horizon):
-                    if hasattr(self, "drives") and len(self.drives) > 0:
-                        self_obj = self.drives[0]
-                    else:
-                        self_obj = self
                     int_path = self_obj.intersects_path_with(obj, delta_t=delta_t, horizon=horizon)
                     if None not in int_path:
                         res.append(tuple([obj]) + int_path)
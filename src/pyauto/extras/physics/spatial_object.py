@@ -1,10 +1,9 @@
 import logging
 import math
+import numpy
 import owlready2
 
-from functools import cache
-
-from shapely import geometry, wkt, affinity
+from shapely import geometry
 from owlready2_augmentator import augment, augment_class, AugmentationType
 from ... import auto
 from .. import utils
@@ -15,6 +14,40 @@ _SPATIAL_PREDICATE_THRESHOLD = 30  # m, the distance in which spatial predicates
 _IS_NEAR_DISTANCE = 4              # m, the distance for which spatial objects are close to each other
 _IS_IN_PROXIMITY_DISTANCE = 15     # m, the distance for which spatial objects are in proximity to each other
 
+
+def get_points(g: geometry.base.BaseGeometry) -> numpy.ndarray:
+    """
+    Returns the points that represent the given geometry in the directional predicates, i.e., the point itself, the
+    points of the exterior (for polygons), or the centroid otherwise.
+    :param g: The geometry.
+    :returns: A numpy array of shape (N, 2) containing the x and y coordinates of the points.
+    """
+    if isinstance(g, geometry.Point):
+        return numpy.array([[g.x, g.y]])
+    elif hasattr(g, "exterior"):
+        return numpy.asarray(g.exterior.coords)[:, :2]
+    else:
+        c = g.centroid
+        return numpy.array([[c.x, c.y]])
+
+
+def get_relative_positions(points_1: numpy.ndarray, points_2: numpy.ndarray, yaw: float | int) -> tuple:
+    """
+    Vectorized version of utils.get_relative_position() for all pairs of the given points.
+    :param points_1: A numpy array of shape (N, 2) of the points to compute the positions of.
+    :param points_2: A numpy array of shape (M, 2) of the viewing points.
+    :param yaw: The viewing angle (in °).
+    :returns: A tuple of (N, M) numpy arrays: The cross products (positive iff. left), the distances of the points, and
+        whether the points coincide.
+    """
+    cos_yaw, sin_yaw = utils.get_yaw_vector(yaw)
+    dx = points_1[:, None, 0] - points_2[None, :, 0]
+    dy = points_1[:, None, 1] - points_2[None, :, 1]
+    coincide = numpy.isclose(points_1[:, None, 0], points_2[None, :, 0], rtol=1e-09, atol=0) & \
+        numpy.isclose(points_1[:, None, 1], points_2[None, :, 1], rtol=1e-09, atol=0)
+    return cos_yaw * dy - sin_yaw * dx, numpy.hypot(dx, dy), coincide
+
+
 physics = auto.world.get_ontology(auto.Ontology.Physics.value)
 
 with physics:
@@ -49,14 +82,15 @@ with physics:
                          (x + length / 2, y + width / 2),
                          (x - length / 2, y + width / 2),
                          (x - length / 2, y - width / 2)]
-                g = geometry.Polygon(p)
                 if rotate != 0:
-                    g = affinity.rotate(g, rotate, origin="centroid")
-                geom.asWKT = [g.wkt]
+                    # rotates the corners analytically around the centroid (x, y) of the rectangle
+                    cos_rot, sin_rot = utils.get_yaw_vector(rotate)
+                    p = [(x + cos_rot * (p_x - x) - sin_rot * (p_y - y), y + sin_rot * (p_x - x) + cos_rot * (p_y - y))
+                         for p_x, p_y in p]
+                geom.asWKT = [geometry.Polygon(p).wkt]
                 self.has_length = length
                 self.has_width = width
             self.hasGeometry = [geom]
-            self.get_geometry.cache_clear()
 
         def set_shapely_geometry(self, geometry: geometry.base.BaseGeometry):
             """
@@ -67,40 +101,68 @@ with physics:
             geom.asWKT = [geometry.wkt]
             self.hasGeometry = [geom]
 
+        def get_wkt(self) -> str:
+            """
+            Returns the WKT literal of the geometry of this object, reading the ontology only once.
+            :returns: The WKT string or None if this object does not have a (non-empty) geometry.
+            """
+            try:
+                wkt_str = self.hasGeometry[0].asWKT[0]
+            except (AttributeError, IndexError, TypeError):
+                return None
+            if wkt_str != "POLYGON EMPTY":
+                return wkt_str
+
         def has_geometry(self) -> bool:
             """
             Returns true iff x has a geometry represented as a WKT literal.
             :returns: whether this object has a geometry.
             """
-            try:
-                return hasattr(self, "hasGeometry") and len(self.hasGeometry) > 0 and \
-                    len(self.hasGeometry[0].asWKT) > 0 and self.hasGeometry[0].asWKT[0] != "POLYGON EMPTY"
-            except TypeError:
-                return False
+            return self.get_wkt() is not None
 
-        @cache
         def get_geometry(self) -> geometry.base.BaseGeometry:
             """
             Returns the geometry as a shapely BaseGeometry of this object, only if this object has a geometry.
-            Otherwise, it returns None.
+            Otherwise, it returns None. The parsed geometry is cached on the WKT string, i.e., it stays valid as long as
+            the geometry of this object is not changed.
             :returns: The geometry of this object or None.
             """
-            if self.has_geometry():
-                return wkt.loads(self.hasGeometry[0].asWKT[0])
+            wkt_str = self.get_wkt()
+            if wkt_str is not None:
+                return utils.load_wkt(wkt_str)
 
-        @cache
         def get_centroid(self) -> geometry.Point:
             """
             :return: The centroid of the geometry of this object or None if this object does not have a geometry.
             """
-            if self.has_geometry():
-                return self.get_geometry().centroid
+            wkt_str = self.get_wkt()
+            if wkt_str is not None:
+                return utils.get_wkt_centroid(wkt_str)
+
+        def get_geometry_coords(self) -> numpy.ndarray:
+            """
+            :return: The 2D coordinates of the geometry (of the exterior for polygons) of this object as a read-only
+                numpy array of shape (N, 2) or None if this object does not have a geometry.
+            """
+            wkt_str = self.get_wkt()
+            if wkt_str is not None:
+                return utils.get_wkt_coords(wkt_str)
+
+        def prediction(self, delta_t: float | int = 0.1, horizon: float | int = 8):
+            """
+            Prediction of the geometry of this object over time. Spatial objects are assumed to be static, dynamical
+            objects override this method with an actual prediction model.
+            :param delta_t: The time delta for sampling.
+            :param horizon: The time horizon (max. time that is sampled) for prediction.
+            :return: A list of tuples of `shapely` geometries and time stamps, where each geometry represents the object
+                at the given point in time.
+            """
+            geo = self.get_geometry()
+            return [(geo, i) for i in numpy.arange(delta_t, horizon + delta_t, delta_t)]
 
         def get_distance(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                p1 = wkt.loads(self.hasGeometry[0].asWKT[0])
-                p2 = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return float(p1.distance(p2))
+                return float(self.get_geometry().distance(other.get_geometry()))
 
         def compute_angle_between_yaw_and_point(self, p) -> float:
             """
@@ -109,10 +171,10 @@ with physics:
             :param p: A point (list, tuple, or geometry.Point)
             :returns: An angle a in degrees (0 <= a < 360)
             """
-            geom = self.get_geometry()
-            if geom is not None and self.has_yaw is not None:
-                p_yaw = [math.cos(math.radians(self.has_yaw)), math.sin(math.radians(self.has_yaw))]
-                p_self = [p[0] - geom.centroid.x, p[1] - geom.centroid.y]
+            c = self.get_centroid()
+            if c is not None and self.has_yaw is not None:
+                p_yaw = utils.get_yaw_vector(self.has_yaw)
+                p_self = [p[0] - c.x, p[1] - c.y]
                 angle = math.degrees(math.atan2(*p_yaw) - math.atan2(*p_self)) % 360
                 return angle
 
@@ -121,65 +183,58 @@ with physics:
             :param p: A point (list, tuple, or geometry.Point)
             :returns: True iff. p is right of self, given self has a yaw to determine its direction. None otherwise.
             """
-            geom = self.get_geometry()
-            if geom is not None and self.has_yaw is not None:
-                p_yaw = [math.cos(math.radians(self.has_yaw)), math.sin(math.radians(self.has_yaw))]
-                p_self = [p[0] - geom.centroid.x, p[1] - geom.centroid.y]
-                angle = math.degrees(math.atan2(*p_self)) - math.degrees(math.atan2(*p_yaw))
-                return (0 < angle < 180) or (-360 < angle < -180)
+            c = self.get_centroid()
+            if c is not None and self.has_yaw is not None:
+                cos_yaw, sin_yaw = utils.get_yaw_vector(self.has_yaw)
+                return cos_yaw * (p[1] - c.y) - sin_yaw * (p[0] - c.x) < 0
 
 
+        def compute_corner_points(self) -> tuple:
+            """
+            Computes the left front, right front, left back, and right back points of self's boundary (determined
+            through its yaw) in a single pass over its vertices. If this object does not have a yaw, returns None for
+            each point. For non-polygonal geometries, the centroid is returned for each point.
+            :returns: A tuple of the four corner points (each as a tuple, or None if there is no such point).
+            """
+            g = self.get_geometry()
+            if g is None:
+                return (None, ) * 4
+            c = self.get_centroid()
+            if not isinstance(g, geometry.Polygon):
+                return ((c.x, c.y), ) * 4
+            if self.has_yaw is None:
+                return (None, ) * 4
+            coords = self.get_geometry_coords()
+            angles = (numpy.degrees(numpy.arctan2(coords[:, 1] - c.y, coords[:, 0] - c.x)) - self.has_yaw) % 360
+            corners = []
+            for lower in (270, 0, 180, 90):
+                i = numpy.flatnonzero((lower <= angles) & (angles < lower + 90))
+                corners.append(tuple(coords[i[0]].tolist()) if len(i) > 0 else None)
+            return tuple(corners)
+
         def compute_left_front_point(self) -> tuple:
             """
             :returns: The left front point of self's boundary (front-left determined through its yaw).
             """
-            try:
-                g = self.get_geometry()
-                for p in zip(g.boundary.xy[0], g.boundary.xy[1]):
-                    angle = self.compute_angle_between_yaw_and_point(p)
-                    if 270 <= angle < 360:
-                        return p
-            except NotImplementedError:
-                return self.centroid
+            return self.compute_corner_points()[0]
 
         def compute_right_front_point(self) -> tuple:
             """
             :returns: The right front point of self's boundary (front-left determined through its yaw).
             """
-            try:
-                g = self.get_geometry()
-                for p in zip(g.boundary.xy[0], g.boundary.xy[1]):
-                    angle = self.compute_angle_between_yaw_and_point(p)
-                    if 0 <= angle < 90:
-                        return p
-            except NotImplementedError:
-                return self.centroid
+            return self.compute_corner_points()[1]
 
         def compute_left_back_point(self) -> tuple:
             """
             :returns: The right front point of self's boundary (front-left determined through its yaw).
             """
-            try:
-                g = self.get_geometry()
-                for p in zip(g.boundary.xy[0], g.boundary.xy[1]):
-                    angle = self.compute_angle_between_yaw_and_point(p)
-                    if 180 <= angle < 270:
-                        return p
-            except NotImplementedError:
-                return self.centroid
+            return self.compute_corner_points()[2]
 
         def compute_right_back_point(self) -> tuple:
             """
             :returns: The right front point of self's boundary (front-left determined through its yaw).
             """
-            try:
-                g = self.get_geometry()
-                for p in zip(g.boundary.xy[0], g.boundary.xy[1]):
-                    angle = self.compute_angle_between_yaw_and_point(p)
-                    if 90 <= angle < 180:
-                        return p
-            except NotImplementedError:
-                return self.centroid
+            return self.compute_corner_points()[3]
 
         def convert_local_to_global_vector(self, v: list) -> tuple:
             """
@@ -187,201 +242,171 @@ with physics:
             If this object does not have a yaw, returns None.
             :param v: A list of scalars
             """
-            if self.get_yaw() is not None:
-                vx = math.cos(math.radians(self.get_yaw())) * v[0] - math.sin(math.radians(self.get_yaw())) * v[1]
-                vy = math.sin(math.radians(self.get_yaw())) * v[0] + math.cos(math.radians(self.get_yaw())) * v[1]
+            yaw = self.get_yaw()
+            if yaw is not None:
+                cos_yaw, sin_yaw = utils.get_yaw_vector(yaw)
+                vx = cos_yaw * v[0] - sin_yaw * v[1]
+                vy = sin_yaw * v[0] + cos_yaw * v[1]
                 return vx, vy
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_in_proximity")
         def in_proximity(self, other: physics.Spatial_Object):
-            if other is not None and self.has_geometry() and other.has_geometry():
-                p1 = wkt.loads(self.hasGeometry[0].asWKT[0])
-                p2 = wkt.loads(other.hasGeometry[0].asWKT[0])
-                if float(p1.distance(p2)) < _IS_IN_PROXIMITY_DISTANCE:
-                    return True
+            if other is not None:
+                p1 = self.get_geometry()
+                p2 = other.get_geometry()
+                if p1 is not None and p2 is not None:
+                    distance = utils.get_distance_up_to(p1, p2, _IS_IN_PROXIMITY_DISTANCE)
+                    if distance is not None and distance < _IS_IN_PROXIMITY_DISTANCE:
+                        return True
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_near")
         def near(self, other: physics.Spatial_Object):
-            if other is not None and self.has_geometry() and other.has_geometry():
-                p1 = wkt.loads(self.hasGeometry[0].asWKT[0])
-                p2 = wkt.loads(other.hasGeometry[0].asWKT[0])
-                if float(p1.distance(p2)) < _IS_NEAR_DISTANCE:
-                    return True
+            if other is not None:
+                p1 = self.get_geometry()
+                p2 = other.get_geometry()
+                if p1 is not None and p2 is not None:
+                    distance = utils.get_distance_up_to(p1, p2, _IS_NEAR_DISTANCE)
+                    if distance is not None and distance < _IS_NEAR_DISTANCE:
+                        return True
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfIntersects")
         def intersects(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.intersects(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.intersects(geo_other)
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfOverlaps")
         def overlaps(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.overlaps(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.overlaps(geo_other)
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfTouches")
         def touches(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.touches(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.touches(geo_other)
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfWithin")
         def within(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.within(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.within(geo_other)
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfDisjoint")
         def disjoint(self, other: physics.Spatial_Object):
-            if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                if float(geo_self.distance(geo_other)) <= _SPATIAL_PREDICATE_THRESHOLD:
-                    return geo_self.disjoint(geo_other)
+            if other is not None:
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                if geo_self is not None and geo_other is not None:
+                    distance = utils.get_distance_up_to(geo_self, geo_other, _SPATIAL_PREDICATE_THRESHOLD)
+                    if distance is not None and distance <= _SPATIAL_PREDICATE_THRESHOLD:
+                        # geometries are disjoint iff. they have a positive distance
+                        return distance > 0
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfCrosses")
         def crosses(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.crosses(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.crosses(geo_other)
 
         @augment(AugmentationType.OBJECT_PROPERTY, "sfContains")
         def contains(self, other: physics.Spatial_Object):
             if other is not None and self.has_geometry() and other.has_geometry():
-                geo_self = wkt.loads(self.hasGeometry[0].asWKT[0])
-                geo_other = wkt.loads(other.hasGeometry[0].asWKT[0])
-                return geo_self.contains(geo_other)
+                geo_self = self.get_geometry()
+                geo_other = other.get_geometry()
+                return utils.bounds_intersect(geo_self.bounds, geo_other.bounds) and geo_self.contains(geo_other)
+
+        def get_directional_position(self, other: physics.Dynamical_Object) -> tuple[float, float]:
+            """
+            Computes the position of self's centroid relative to other's centroid and yaw as used by the directional
+            predicates (see utils.get_relative_position()). Reads all required properties only once.
+            :param other: The object from which self is viewed.
+            :returns: A tuple (dot product, cross product), (0, 0) if the centroids coincide, or None if the
+                directional predicates are not applicable (no geometry, no yaw, or farther away than the threshold).
+            """
+            if other is None or self == other:
+                return None
+            yaw = other.has_yaw
+            if yaw is None:
+                return None
+            p_1 = self.get_centroid()
+            p_2 = other.get_centroid()
+            if p_1 is None or p_2 is None:
+                return None
+            dx = p_1.x - p_2.x
+            dy = p_1.y - p_2.y
+            if math.hypot(dx, dy) > _SPATIAL_PREDICATE_THRESHOLD:
+                return None
+            if math.isclose(p_1.x, p_2.x) and math.isclose(p_1.y, p_2.y):
+                return 0.0, 0.0
+            cos_yaw, sin_yaw = utils.get_yaw_vector(yaw)
+            return cos_yaw * dx + sin_yaw * dy, cos_yaw * dy - sin_yaw * dx
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_behind")
         def behind(self, other: physics.Dynamical_Object):
-            if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
-                    other.has_yaw is not None:
-                p_1 = wkt.loads(self.hasGeometry[0].asWKT[0]).centroid
-                p_2 = wkt.loads(other.hasGeometry[0].asWKT[0]).centroid
-                if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD and not (math.isclose(p_1.x, p_2.x) and
-                                                                                     math.isclose(p_1.y, p_2.y)):
-                    p_yaw = [math.cos(math.radians(other.has_yaw)), math.sin(math.radians(other.has_yaw))]
-                    p_self = [p_1.x - p_2.x, p_1.y - p_2.y]
-                    angle = math.degrees(math.atan2(*p_yaw) - math.atan2(*p_self)) % 360
-                    return 90 < angle < 270
+            pos = self.get_directional_position(other)
+            if pos is not None:
+                return pos[0] < 0
 
         @staticmethod
         def left(p_1, p_2, yaw):
             if not (math.isclose(p_1.x, p_2.x) and math.isclose(p_1.y, p_2.y)):
-                p_yaw = [math.sin(math.radians(yaw)), math.cos(math.radians(yaw))]
-                p_self = [p_1.y - p_2.y, p_1.x - p_2.x]
-                angle = math.degrees(math.atan2(*p_yaw) - math.atan2(*p_self)) % 360
-                return 180 < angle < 360
+                return utils.get_relative_position(p_1, p_2, yaw)[1] > 0
             else:
                 return False
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_left_of")
         def left_of(self, other: physics.Dynamical_Object):
-            if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
-                    other.has_yaw is not None:
-                p_1 = wkt.loads(self.hasGeometry[0].asWKT[0]).centroid
-                p_2 = wkt.loads(other.hasGeometry[0].asWKT[0]).centroid
-                if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD:
-                    return self.left(p_1, p_2, other.has_yaw)
+            pos = self.get_directional_position(other)
+            if pos is not None:
+                return pos[1] > 0
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_properly_left_of")
         def left_properly_of(self, other: physics.Dynamical_Object):
             if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
                     other.has_yaw is not None:
-                g_1 = self.get_geometry()
-                g_2 = other.get_geometry()
-                if isinstance(g_1, geometry.Point):
-                    p_1s = [g_1]
-                elif hasattr(g_1, "exterior"):
-                    p_1s = [geometry.Point(p) for p in g_1.exterior.coords]
-                else:
-                    p_1s = [g_1.centroid]
-                if isinstance(g_2, geometry.Point):
-                    p_2s = [g_2]
-                elif hasattr(g_2, "exterior"):
-                    p_2s = [geometry.Point(p) for p in g_2.exterior.coords]
-                else:
-                    p_2s = [g_2.centroid]
-                is_left = True
-                for p_1 in p_1s:
-                    for p_2 in p_2s:
-                        if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD:
-                            is_left &= self.left(p_1, p_2, other.has_yaw)
-                        else:
-                            is_left = False
-                        if not is_left:
-                            break
-                return is_left
+                crosses, distances, coincide = get_relative_positions(get_points(self.get_geometry()),
+                                                                       get_points(other.get_geometry()), other.has_yaw)
+                return bool(numpy.all((distances <= _SPATIAL_PREDICATE_THRESHOLD) & ~coincide & (crosses > 0)))
 
         @staticmethod
         def right(p_1, p_2, yaw):
             if not (math.isclose(p_1.x, p_2.x) and math.isclose(p_1.y, p_2.y)):
-                p_yaw = [math.sin(math.radians(yaw)), math.cos(math.radians(yaw))]
-                p_self = [p_1.y - p_2.y, p_1.x - p_2.x]
-                angle = math.degrees(math.atan2(*p_yaw) - math.atan2(*p_self)) % 360
-                return 0 < angle < 180
+                return utils.get_relative_position(p_1, p_2, yaw)[1] < 0
             else:
                 return False
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_right_of")
         def right_of(self, other: physics.Dynamical_Object):
-            if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
-                    other.has_yaw is not None:
-                p_1 = wkt.loads(self.hasGeometry[0].asWKT[0]).centroid
-                p_2 = wkt.loads(other.hasGeometry[0].asWKT[0]).centroid
-                if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD:
-                    return self.right(p_1, p_2, other.has_yaw)
+            pos = self.get_directional_position(other)
+            if pos is not None:
+                return pos[1] < 0
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_properly_right_of")
         def right_properly_of(self, other: physics.Dynamical_Object):
             if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
                     other.has_yaw is not None:
-                g_1 = self.get_geometry()
-                g_2 = other.get_geometry()
-                if isinstance(g_1, geometry.Point):
-                    p_1s = [g_1]
-                elif hasattr(g_1, "exterior"):
-                    p_1s = [geometry.Point(p) for p in g_1.exterior.coords]
-                else:
-                    p_1s = [g_1.centroid]
-                if isinstance(g_2, geometry.Point):
-                    p_2s = [g_2]
-                elif hasattr(g_2, "exterior"):
-                    p_2s = [geometry.Point(p) for p in g_2.exterior.coords]
-                else:
-                    p_2s = [g_2.centroid]
-                is_right = True
-                for p_1 in p_1s:
-                    for p_2 in p_2s:
-                        if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD:
-                            is_right &= self.right(p_1, p_2, other.has_yaw)
-                        else:
-                            is_right = False
-                        if not is_right:
-                            break
-                return is_right
+                crosses, distances, coincide = get_relative_positions(get_points(self.get_geometry()),
+                                                                       get_points(other.get_geometry()), other.has_yaw)
+                return bool(numpy.all((distances <= _SPATIAL_PREDICATE_THRESHOLD) & ~coincide & (crosses < 0)))
 
         @augment(AugmentationType.OBJECT_PROPERTY, "is_in_front_of")
         def in_front_of(self, other: physics.Dynamical_Object):
-            if other is not None and self != other and self.has_geometry() and other.has_geometry() and \
-                    other.has_yaw is not None:
-                p_1 = wkt.loads(self.hasGeometry[0].asWKT[0]).centroid
-                p_2 = wkt.loads(other.hasGeometry[0].asWKT[0]).centroid
-                if float(p_1.distance(p_2)) <= _SPATIAL_PREDICATE_THRESHOLD and not (math.isclose(p_1.x, p_2.x) and
-                                                                                     math.isclose(p_1.y, p_2.y)):
-                    return utils.in_front_of(p_1, p_2, other.has_yaw)
+            pos = self.get_directional_position(other)
+            if pos is not None:
+                return pos[0] > 0
 
-        @cache
         def get_end(self, angle: float, p: tuple, length: float=1) -> geometry.Polygon:
             """
             Returns the end of the spatial object when viewed from the given point at the given angle.
             Assumption: Only works if the geometry of this object is given as a polygon with a symmetrical point list.
+            Results are cached on this object as long as its geometry does not change.
             :param angle: Viewing angle (in degrees, global)
             :param p: Viewing point (as tuple)
             :param length: Length (meters) of the end piece to find, default is 1 meter.
@@ -389,27 +414,29 @@ with physics:
                 be uniquely determined (i.e., p is exactly in the middle and the angle points similarly away w.r.t. both
                 ends.
             """
-            def get_incremental_closest_point_from_yaw(line, p, angle, init_field_of_relevance=60,
-                                                       max_field_over_relevance=100, step_size=10):
-                i = 0
-                p_c = None
-                while p_c is None and init_field_of_relevance + i <= max_field_over_relevance:
-                    p_c = utils.get_closest_point_from_yaw(line, p, angle, init_field_of_relevance + i)
-                    i += step_size
-                return p_c
-
+            wkt_str = self.get_wkt()
+            ends = getattr(self, "_ends", None)
+            if ends is None or ends[0] != wkt_str:
+                ends = self._ends = (wkt_str, {})
+            if (angle, p, length) not in ends[1]:
+                ends[1][(angle, p, length)] = self._get_end(angle, p, length)
+            return ends[1][(angle, p, length)]
+
+        def _get_end(self, angle: float, p: tuple, length: float) -> geometry.Polygon:
             p = geometry.Point(p)
             g = self.get_geometry()
-            _, _, front, back = utils.split_polygon_into_boundaries(g)
-            p_f = get_incremental_closest_point_from_yaw(front, p, angle)
-            p_b = get_incremental_closest_point_from_yaw(back, p, angle)
+            _, _, front, back = utils.split_coords_into_boundaries(self.get_geometry_coords())
+            p_f = utils.get_closest_point_from_widening_yaw(front, p, angle)
+            p_b = utils.get_closest_point_from_widening_yaw(back, p, angle)
+            d_f = p_f.distance(p) if p_f is not None else math.inf
+            d_b = p_b.distance(p) if p_b is not None else math.inf
             end = None
-            if p_b is None or (p_f is not None and p_f.distance(p) < p_b.distance(p)):
+            if p_b is None or d_f < d_b:
                 end = front
-            elif p_f is None or (p_b is not None and p_f.distance(p) >= p_b.distance(p)):
+            elif d_f >= d_b:
                 end = back
             if end is not None:
-                return end.centroid.buffer(length * 2).intersection(g)
+                return geometry.Point(end.mean(axis=0)).buffer(length * 2).intersection(g)
             else:
                 logger.warning("No end found for object " + str(self) + " from " + str(p) + " angled " + str(angle))
                 return g
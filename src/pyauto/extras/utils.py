@@ -1,6 +1,9 @@
 import math
 import logging
+import numpy
 
+from functools import lru_cache
+from shapely import wkt
 from shapely.geometry import Polygon, LineString, Point
 
 logger = logging.getLogger(__name__)
@@ -17,20 +20,25 @@ def split_polygon_into_boundaries(p: Polygon) -> tuple[LineString, LineString, L
     :param p: The `Polygon` to split
     :returns: A tuple of new `LineString`s
     """
-    coords = p.boundary.coords[:-1]  # last point is the first for a polygon - ignore it
+    left, right, front, back = split_coords_into_boundaries(numpy.asarray(p.boundary.coords))
+    return LineString(left), LineString(right), LineString(front), LineString(back)
+
+
+def split_coords_into_boundaries(coords: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray,
+                                                                 numpy.ndarray]:
+    """
+    Array version of split_polygon_into_boundaries() that works on the closed coordinate sequence of a polygon's
+    boundary (e.g. as returned by get_wkt_coords()) and does not construct any geometries.
+    :param coords: A numpy array of shape (N, 2) or (N, 3) of the boundary's coordinates, last one equal to the first.
+    :returns: A tuple of numpy arrays containing the coordinates of the left, right, front, and back boundaries
+    """
+    coords = coords[:-1]  # last point is the first for a polygon - ignore it
     assert len(coords) >= 4
-    if len(coords) % 2 == 0:
-        half = int(len(coords) / 2)
-    else:
-        half = int((len(coords) + 1) / 2)
-    right_coords = coords[:half]
-    front_coords = [coords[half - 1], coords[half]]
-    left_coords = list(reversed(coords[half:len(coords)]))
-    back_coords = [coords[0], coords[len(coords) - 1]]
-    right = LineString(right_coords)
-    front = LineString(front_coords)
-    left = LineString(left_coords)
-    back = LineString(back_coords)
+    half = (len(coords) + 1) // 2
+    right = coords[:half]
+    front = coords[half - 1:half + 1]
+    left = coords[:half - 1:-1]
+    back = coords[[0, -1]]
     return left, right, front, back
 
 
@@ -45,72 +53,183 @@ def get_closest_point_from_yaw(ls: LineString, p: Point, yaw: float | int, angle
     :returns: The closes point of the line string based on the yaw or None if there is no point of ls in the 180° field.
     """
 
-    def _get_relevant_points(yaw, p, ls, angle):
+    def _get_relevant_points(yaw, p, coords, angle):
         """
         Helper method to determine the points of ls in front of yaw at point p, where in front of is defined by the
         given angle (which is understood relative to the yaw and draws a 'separating line').
-        :return: A list of relevant points.
+        :return: A boolean numpy array stating for each of the coordinates whether it is relevant.
         """
         yaw_p = (yaw + angle) % 360
-        p_2 = Point(math.cos(math.radians(yaw_p)) + p.x, math.sin(math.radians(yaw_p)) + p.y)
-        if p_2.x - p.x != 0:
-            m = (p_2.y - p.y) / (p_2.x - p.x)
+        cos_yaw_p, sin_yaw_p = get_yaw_vector(yaw_p)
+        p_2_x = cos_yaw_p + p.x
+        p_2_y = sin_yaw_p + p.y
+        if p_2_x - p.x != 0:
+            m = (p_2_y - p.y) / (p_2_x - p.x)
             b = p.y - m * p.x
-        else:  # case: yaw - angle is 90° or 270°
-            m = None
-            b = None
-        relevant_points = []
-        for lp in ls.coords:
-            if m is not None:
-                div_y = m * lp[0] + b
-                if angle < 0:  # right of yaw
-                    if 90 < yaw_p <= 270:
-                        if lp[1] <= div_y:
-                            relevant_points.append(lp)
-                    else:
-                        if lp[1] >= div_y:
-                            relevant_points.append(lp)
-                else:  # left of yaw:
-                    if 90 < yaw_p <= 270:
-                        if lp[1] >= div_y:
-                            relevant_points.append(lp)
-                    else:
-                        if lp[1] <= div_y:
-                            relevant_points.append(lp)
-            else:
-                if angle < 0:  # right of yaw
-                    if yaw_p == 90:
-                        if lp[0] <= p.x:
-                            relevant_points.append(lp)
-                    elif yaw_p == 270:
-                        if lp[0] >= p.x:
-                            relevant_points.append(lp)
-                else:  # left of yaw
-                    if yaw_p == 90:
-                        if lp[0] >= p.x:
-                            relevant_points.append(lp)
-                    elif yaw_p == 270:
-                        if lp[0] <= p.x:
-                            relevant_points.append(lp)
-        return relevant_points
-
-    rel_points_1 = _get_relevant_points(yaw, p, ls, angle / 2)
+            div_y = m * coords[:, 0] + b
+            # points below the separating line are relevant iff. right of yaw with 90° < yaw_p <= 270°, or left of
+            # yaw otherwise
+            below = (angle < 0) == (90 < yaw_p <= 270)
+            return coords[:, 1] <= div_y if below else coords[:, 1] >= div_y
+        elif yaw_p == 90 or yaw_p == 270:  # case: yaw - angle is 90° or 270°
+            left = (angle < 0) == (yaw_p == 90)
+            return coords[:, 0] <= p.x if left else coords[:, 0] >= p.x
+        else:
+            return numpy.zeros(len(coords), dtype=bool)
+
+    coords = numpy.asarray(ls.coords)
+    relevant = _get_relevant_points(yaw, p, coords, angle / 2)
     if not math.isclose(angle, 180):
-        rel_points_2 = _get_relevant_points(yaw, p, ls, - angle / 2)
-    else:
-        rel_points_2 = rel_points_1
-    p_closest = None
-    closest = None
-    if angle < 180:
-        rps = set(rel_points_1).intersection(set(rel_points_2))
-    else:
-        rps = set(rel_points_1).union(set(rel_points_2))
-    for rp in rps:
-        dist = p.distance(Point(rp))
-        if p_closest is None or dist < closest:
-            p_closest = Point(rp)
-            closest = dist
-    return p_closest
+        if angle < 180:
+            relevant &= _get_relevant_points(yaw, p, coords, - angle / 2)
+        else:
+            relevant |= _get_relevant_points(yaw, p, coords, - angle / 2)
+    if not relevant.any():
+        return None
+    rps = coords[relevant]
+    return Point(rps[numpy.argmin(numpy.hypot(rps[:, 0] - p.x, rps[:, 1] - p.y))])
+
+
+def get_closest_point_from_widening_yaw(coords: numpy.ndarray, p: Point, yaw: float | int, min_angle: float | int = 60,
+                                        max_angle: float | int = 100, step_size: float | int = 10) -> Point:
+    """
+    Finds the nearest point in the line string within the smallest viewing angle around the yaw that contains any point
+    at all, where the viewing angle is widened from min_angle to max_angle in the given steps. This is equivalent to
+    calling get_closest_point_from_yaw() with increasing angles until a point is found, but computes the angular
+    deviation of the points from the yaw only once.
+    :param coords: The coordinates of the line string to examine as a numpy array of shape (N, 2)
+    :param p: The point for which to get the closest point
+    :param yaw: The viewing angle to consider when looking for the closest point.
+    :param min_angle: The initial viewing angle (in °).
+    :param max_angle: The maximum viewing angle (in °).
+    :param step_size: The step size (in °) in which the viewing angle is widened.
+    :returns: The closest point of the line string or None if there is no point in the maximum viewing angle.
+    """
+    cos_yaw, sin_yaw = get_yaw_vector(yaw)
+    dx = coords[:, 0] - p.x
+    dy = coords[:, 1] - p.y
+    deviations = numpy.abs(numpy.degrees(numpy.arctan2(cos_yaw * dy - sin_yaw * dx, cos_yaw * dx + sin_yaw * dy)))
+    # Points that coincide with p are within any viewing angle (arctan2 of signed zeros can yield 180° otherwise)
+    deviations[(dx == 0) & (dy == 0)] = 0
+    angle = min_angle
+    while angle <= max_angle:
+        relevant = deviations <= angle / 2
+        if relevant.any():
+            rps = coords[relevant]
+            return Point(rps[numpy.argmin(numpy.hypot(dx[relevant], dy[relevant]))])
+        angle += step_size
+
+
+@lru_cache(maxsize=4096)
+def load_wkt(wkt_str: str):
+    """
+    Parses the given WKT string into a shapely geometry. Results are memoized on the WKT string itself, so repeated
+    queries on the same geometry (e.g. pairwise augmentation) do not re-parse it, and writing a new geometry to an
+    object automatically yields a new cache entry. The returned geometry is shared and must therefore not be mutated.
+    Simple points and polygons without holes, as created by `set_geometry`, are parsed directly, all other WKT
+    strings are parsed by shapely.
+    :param wkt_str: The WKT string to parse.
+    :returns: The shapely geometry represented by the WKT string.
+    """
+    try:
+        if wkt_str.startswith("POINT (") and wkt_str.endswith(")"):
+            return Point(*map(float, wkt_str[7:-1].split()))
+        elif wkt_str.startswith("POLYGON ((") and wkt_str.endswith("))") and "(" not in wkt_str[10:-2]:
+            return Polygon([tuple(map(float, c.split())) for c in wkt_str[10:-2].split(",")])
+    except (ValueError, TypeError):
+        pass
+    return wkt.loads(wkt_str)
+
+
+@lru_cache(maxsize=4096)
+def get_wkt_centroid(wkt_str: str) -> Point:
+    """
+    Computes the centroid of the geometry represented by the given WKT string. Results are memoized on the WKT string.
+    :param wkt_str: The WKT string of the geometry.
+    :returns: The centroid of the geometry.
+    """
+    return load_wkt(wkt_str).centroid
+
+
+@lru_cache(maxsize=4096)
+def get_wkt_coords(wkt_str: str) -> numpy.ndarray:
+    """
+    Extracts the 2D coordinates of the geometry represented by the given WKT string (of the exterior for polygons).
+    Results are memoized on the WKT string, and the returned array is therefore read-only.
+    :param wkt_str: The WKT string of the geometry.
+    :returns: A numpy array of shape (N, 2) containing the coordinates.
+    """
+    g = load_wkt(wkt_str)
+    coords = numpy.asarray(g.exterior.coords if hasattr(g, "exterior") else g.coords, dtype=numpy.float64)[:, :2]
+    coords.setflags(write=False)
+    return coords
+
+
+@lru_cache(maxsize=4096)
+def get_yaw_vector(yaw: float | int) -> tuple[float, float]:
+    """
+    Computes the unit vector pointing in the direction of the given yaw angle. Results are memoized on the yaw, as the
+    same yaws are converted over and over again in pairwise computations.
+    :param yaw: The yaw angle (in °).
+    :returns: A tuple (cos(yaw), sin(yaw)).
+    """
+    r = math.radians(yaw)
+    return math.cos(r), math.sin(r)
+
+
+def get_bounds_distance(b_1: tuple, b_2: tuple) -> float:
+    """
+    Computes the distance between two axis-aligned bounding boxes. This is a cheap lower bound of the distance between
+    the geometries enclosed by the bounding boxes.
+    :param b_1: The first bounding box as a tuple (min x, min y, max x, max y), e.g. from a geometry's bounds.
+    :param b_2: The second bounding box as a tuple (min x, min y, max x, max y).
+    :returns: The distance between the bounding boxes, 0 if they overlap.
+    """
+    dx = max(b_1[0] - b_2[2], b_2[0] - b_1[2], 0)
+    dy = max(b_1[1] - b_2[3], b_2[1] - b_1[3], 0)
+    return math.hypot(dx, dy)
+
+
+def get_distance_up_to(g_1, g_2, max_distance: float | int) -> float | None:
+    """
+    Computes the distance between two geometries only if they can be within the given maximum distance at all, i.e.,
+    the exact (and comparably expensive) distance computation is skipped if their bounding boxes are already too far
+    apart.
+    :param g_1: The first shapely geometry.
+    :param g_2: The second shapely geometry.
+    :param max_distance: The maximum distance of interest.
+    :returns: The distance between the geometries, or None if it is known to be larger than max_distance.
+    """
+    if get_bounds_distance(g_1.bounds, g_2.bounds) <= max_distance:
+        return float(g_1.distance(g_2))
+
+
+def bounds_intersect(b_1: tuple, b_2: tuple) -> bool:
+    """
+    Checks whether two axis-aligned bounding boxes intersect (including touching). Geometries whose bounding boxes do
+    not intersect can neither intersect, overlap, touch, cross nor contain each other.
+    :param b_1: The first bounding box as a tuple (min x, min y, max x, max y), e.g. from a geometry's bounds.
+    :param b_2: The second bounding box as a tuple (min x, min y, max x, max y).
+    :returns: True iff. the bounding boxes intersect.
+    """
+    return b_1[0] <= b_2[2] and b_2[0] <= b_1[2] and b_1[1] <= b_2[3] and b_2[1] <= b_1[3]
+
+
+def get_relative_position(p_1: Point, p_2: Point, yaw: float | int) -> tuple[float, float]:
+    """
+    Computes the position of p_1 relative to p_2 in the coordinate system spanned by the given yaw, i.e., the dot and
+    cross product of the yaw vector and the vector from p_2 to p_1. The dot product is positive iff. p_1 is in front of
+    p_2, and the cross product is positive iff. p_1 is left of p_2.
+    :param p_1: The point to compute the position of.
+    :param p_2: The viewing point.
+    :param yaw: The viewing angle (in °).
+    :returns: A tuple (dot product, cross product).
+    """
+    cos_yaw, sin_yaw = get_yaw_vector(yaw)
+    dx = p_1.x - p_2.x
+    dy = p_1.y - p_2.y
+    return cos_yaw * dx + sin_yaw * dy, cos_yaw * dy - sin_yaw * dx
+
 
 def in_front_of(p_1: Point, p_2: Point, yaw: int | float, restrict_viewing_angle_by: int | float = 0) -> bool:
     """
@@ -123,7 +242,5 @@ def in_front_of(p_1: Point, p_2: Point, yaw: int | float, restrict_viewing_angle
     """
     assert restrict_viewing_angle_by < 180
     offset_angle = restrict_viewing_angle_by / 2
-    p_yaw = [math.cos(math.radians(yaw)), math.sin(math.radians(yaw))]
-    p_self = [p_1.x - p_2.x, p_1.y - p_2.y]
-    angle = math.degrees(math.atan2(*p_yaw) - math.atan2(*p_self)) % 360
-    return angle < 90 - offset_angle or angle > 270 + offset_angle
+    dot, cross = get_relative_position(p_1, p_2, yaw)
+    return dot > math.hypot(dot, cross) * math.sin(math.radians(offset_angle))
@@ -1,8 +1,8 @@
+import itertools
 import logging
 import random
 import pathlib
 import time
-import fileinput
 import os
 import re
 
@@ -14,6 +14,9 @@ from . import scene, scenery
 # Logging
 logger = logging.getLogger(__name__)
 
+_FILE_IMPORT_PATTERN = re.compile(rb'<owl:imports\s+rdf:resource="file:')
+_SCENERY_IMPORT_PATTERN = re.compile(rb'<owl:imports\s+rdf:resource="file:([^"]*)"')
+
 
 class Scenario(list):
     """
@@ -72,8 +75,8 @@ class Scenario(list):
                     self.new_scene(folder=folder, add_extras=add_extras, more_extras=more_extras, load_cp=load_cp,
                                    scenery=scenery, scenery_file=scenery_file)
             if len(self) > 0:
-                self._duration = self[-1]._timestamp - self[0]._timestamp
                 self._max_time = self[-1]._timestamp
+                self._duration = self._max_time - self[0]._timestamp
         else:
             self._load_from_file(file, hertz)
 
@@ -85,51 +88,64 @@ class Scenario(list):
         """
         logger.info("Loading scenario from " + kbs_file)
         self._name = os.path.basename(kbs_file)
-        aboxes = []
         # Parses .kbs file
         kbs_file = os.path.abspath(kbs_file)
         kbs_dir = os.path.abspath(os.path.dirname(kbs_file))
+
+        def iter_aboxes():
+            with open(kbs_file) as file:
+                for line in file:
+                    if not line.startswith("#") and len(line.strip()) > 0:
+                        yield os.path.join(kbs_dir, line.rstrip("\n"))
+
+        # Relative file imports in the ABoxes are resolved w.r.t. the .kbs file's directory, which is restored in any
+        # case after loading
         prev_wd = os.getcwd()
         os.chdir(kbs_dir)
-        with open(kbs_file) as file:
-            for line in file:
-                if not line.startswith("#") and len(line) > 0:
-                    aboxes.append(os.path.join(kbs_dir, line.replace("\n", "")))
-        if len(aboxes) > 0:
-            # Loads scenery first
-            # This assumes only the first file-based import in the first scenario to be the scenery OWL file.
-            with open(aboxes[0], "r") as f:
-                res = re.findall("<owl:imports\s+rdf:resource=\"file:([^\"]*)\"", f.read())
-                if len(res) > 0:
-                    scenery_file = res[0]
-                    logger.debug("Loading scenery from " + scenery_file)
-                    self._scenery = scenery.Scenery(name=scenery_file)
-                    self._scenery.get_ontology("file://" + scenery_file).load()
-            t = 0
-            backup_suffix = ".bak"
-            # Loads all scenes from the .kbs file
-            for abox_file in tqdm.tqdm(aboxes):
-                # Minor modification of file content required s.t. owlready2 can read the OWL file
-                for abox_line in fileinput.input(abox_file, inplace=True, backup=backup_suffix):
-                    if '<owl:imports rdf:resource="file:' in abox_line:
-                        abox_line = abox_line.replace('<owl:imports rdf:resource="file:',
-                                                      '<owl:imports rdf:resource="')
-                    print(abox_line, end='')
-                logger.debug("Loading from " + abox_file)
-                world = scene.Scene(timestamp=t, name=abox_file, parent_scenario=self)
-                if hasattr(self, "_scenery"):
-                    world._scenery = self._scenery
-                onto = world.get_ontology("file://" + abox_file)
-                onto = onto.load()
-                if hasattr(self, "_random"):
-                    world._random = self._random
-                if hasattr(self, "_np_random"):
-                    world._np_random = self._np_random
-                self.append(world)
-                t = round(t + 1 / hertz, 2)
-                # Revert the minor modification
-                os.replace(abox_file + backup_suffix, abox_file)
-            self._max_time = round(t - 1 / hertz, 2)
+        try:
+            aboxes = iter_aboxes()
+            first_abox = next(aboxes, None)
+            if first_abox is not None:
+                # Loads scenery first
+                # This assumes only the first file-based import in the first scenario to be the scenery OWL file.
+                with open(first_abox, "rb") as f:
+                    res = _SCENERY_IMPORT_PATTERN.search(f.read())
+                    if res is not None:
+                        scenery_file = res.group(1).decode()
+                        logger.debug("Loading scenery from " + scenery_file)
+                        self._scenery = scenery.Scenery(name=scenery_file)
+                        self._scenery.get_ontology("file://" + scenery_file).load()
+                t = 0
+                backup_suffix = ".bak"
+                # Loads all scenes from the .kbs file
+                for abox_file in tqdm.tqdm(itertools.chain([first_abox], aboxes)):
+                    # Minor modification of file content required s.t. owlready2 can read the OWL file
+                    with open(abox_file, "rb") as f:
+                        content = f.read()
+                    modified = _FILE_IMPORT_PATTERN.search(content) is not None
+                    if modified:
+                        os.replace(abox_file, abox_file + backup_suffix)
+                        with open(abox_file, "wb") as f:
+                            f.write(_FILE_IMPORT_PATTERN.sub(b'<owl:imports rdf:resource="', content))
+                    try:
+                        logger.debug("Loading from " + abox_file)
+                        world = scene.Scene(timestamp=t, name=abox_file, parent_scenario=self)
+                        if hasattr(self, "_scenery"):
+                            world._scenery = self._scenery
+                        onto = world.get_ontology("file://" + abox_file)
+                        onto = onto.load()
+                    finally:
+                        # Revert the minor modification (also if loading failed)
+                        if modified:
+                            os.replace(abox_file + backup_suffix, abox_file)
+                    if hasattr(self, "_random"):
+                        world._random = self._random
+                    if hasattr(self, "_np_random"):
+                        world._np_random = self._np_random
+                    self.append(world)
+                    t = round(t + 1 / hertz, 2)
+                self._max_time = round(t - 1 / hertz, 2)
+        finally:
             os.chdir(prev_wd)
 
     def _initialize_seed(self, seed: int):
@@ -139,7 +155,7 @@ class Scenario(list):
         """
         self._seed = seed
         self._random = random.Random(seed or 0)
-        self._np_random = numpy.random.RandomState(self._seed or 0)
+        self._np_random = numpy.random.default_rng(self._seed or 0)
 
     def __str__(self):
         return str(self._name)
@@ -174,10 +190,11 @@ class Scenario(list):
         :param position: Optional position at which to insert. If -1, the new scene is added at the end.
         """
         if position == -1:
-            position = len(self)
-        self.insert(position, new_scene)
-        self._duration = self[-1]._timestamp - self[0]._timestamp
+            self.append(new_scene)
+        else:
+            self.insert(position, new_scene)
         self._max_time = self[-1]._timestamp
+        self._duration = self._max_time - self[0]._timestamp
         # Propagates RNGs
         new_scene._random = self._random
         new_scene._np_random = self._np_random
@@ -206,20 +223,23 @@ class Scenario(list):
             file name if create_kbs_file is set.
         """
         def inject_in_filename(filename: str, appendix: str, new_ending: str=None):
-            if "." in filename:
-                s = filename.split(".")
-                s[-2] = s[-2] + appendix
-                if new_ending is not None:
-                    s[-1] = new_ending
-                appended_filename = ".".join(s)
+            path = pathlib.PurePath(filename)
+            if new_ending is None:
+                suffix = path.suffix
             else:
-                if new_ending:
-                    new_ending = "." + new_ending
-                appended_filename = filename + appendix + (new_ending or "")
-            return appended_filename
+                suffix = "." + new_ending if new_ending else ""
+            return str(path.with_name(path.stem + appendix + suffix))
 
         logger.info("Saving ABox...")
 
+        if file is None:
+            # Nothing is written to files, therefore, there is neither a scenery nor a .kbs file to save
+            scene_kargs = dict(format=format, to_ignore=to_ignore, **kargs)
+            for _scene in self:
+                _scene.save_abox(file=None, **scene_kargs)
+            logger.info("Saved ABox of " + str(self))
+            return
+
         # Creates folder in case it does not yet exist
         pathlib.Path(os.path.dirname(file)).mkdir(parents=True, exist_ok=True)
 
@@ -240,27 +260,20 @@ class Scenario(list):
             kbs_file_name = inject_in_filename(file, "", new_ending="kbs")
 
         # Saves all scenes
-        scene_files = []
-        for i, _scene in enumerate(self):
-            scene_file = None
-            if file is not None:
-                if "." in file:
-                    s = file.split(".")
-                    s[len(s) - 2] = s[len(s) - 2] + "_" + str(i)
-                    scene_file = ".".join(s)
-                else:
-                    scene_file = file + "_" + str(i)
-                if create_kbs_file:
-                    scene_files.append(os.path.basename(scene_file))
-            _scene.save_abox(format=format, scenery_file=scenery_file_name, save_scenery=False, file=scene_file,
-                             to_ignore=to_ignore, iri=iri, **kargs)
+        file_path = pathlib.PurePath(file)
+        scene_files = [str(file_path.with_name(file_path.stem + "_" + str(i) + file_path.suffix))
+                       for i in range(len(self))]
+        scene_kargs = dict(format=format, scenery_file=scenery_file_name, save_scenery=False, to_ignore=to_ignore,
+                           iri=iri, **kargs)
+        for _scene, scene_file in zip(self, scene_files):
+            _scene.save_abox(file=scene_file, **scene_kargs)
 
         info_msg = "Saved ABox of " + str(self) + " to " + inject_in_filename(file, "_*")
 
         # Creates .kbs file
         if create_kbs_file:
             with open(kbs_file_name, "w") as f:
-                f.write("\n".join(scene_files))
+                f.writelines(os.path.basename(scene_file) + "\n" for scene_file in scene_files)
             info_msg += " and " + kbs_file_name
 
         logger.info(info_msg)
@@ -293,15 +306,16 @@ class Scenario(list):
         if len(self) > 0 and duration > 0:
             t = time.time()
             start_t = self[-1]._timestamp
-            timestamps = numpy.linspace(start_t + delta_t, start_t + duration, int(duration / delta_t))
+            timestamps = start_t + delta_t * numpy.arange(1, int(round(duration / delta_t)) + 1)
+            if "." in str(delta_t):
+                timestamps = numpy.round(timestamps, len(str(delta_t).split(".")[1]))
+            timestamps = timestamps.tolist()
             logger.info("Simulating " + str(len(timestamps)) + " scenes (" + str(duration) + "s @ " +
                         str(int(1 / delta_t)) + "Hz) of " + str(self))
             if (logger.level >= logging.INFO) or \
                     (logger.level == logging.NOTSET and logging.root.level >= logging.INFO):
                 timestamps = tqdm.tqdm(timestamps)
             for i in timestamps:
-                if "." in str(delta_t):
-                    i = numpy.round(i, len(str(delta_t).split(".")[1]))
                 logger.debug("Simulating scene " + str(i) + " / " + str(start_t + duration))
                 new_scene = self[-1].simulate(delta_t=delta_t, to_keep=to_keep, prioritize=prioritize)
                 self.add_scene(new_scene)
@@ -263,8 +263,9 @@ class Scene(owlready2.World):
             scene) and the newly created scene.
         """
         timestamp = self._timestamp + delta_t
-        if "." in str(delta_t):
-            timestamp = numpy.round(timestamp, len(str(delta_t).split(".")[1]))
+        _, _, decimals = str(delta_t).partition(".")
+        if decimals:
+            timestamp = round(timestamp, len(decimals))
         new = Scene(timestamp=timestamp, parent_scenario=self._scenario, scenery=self._scenery,
                     scenery_file=self._scenery_file, add_extras=self._added_extras, more_extras=self._more_extras,
                     load_cp=self._loaded_cp)
@@ -273,15 +274,17 @@ class Scene(owlready2.World):
         logger.debug("Copying individuals and relations")
 
         # Creates all new individuals
+        existing_iris = {x.iri for x in new.individuals()}
         for ind in self.individuals():
             # Only create individuals that are not already there (e.g. exclude colors)
-            if ind.iri not in [x.iri for x in new.individuals()]:
+            if ind.iri not in existing_iris:
                 if not isinstance(type(ind), owlready2.FusionClass):
                     nsp = new.get_ontology(type(ind).namespace.base_iri)
                     new_ind = getattr(nsp, type(ind).name)(ind.name)
                 else:
                     nsp = new.get_ontology(type(ind).is_a[0].namespace.base_iri)
                     new_ind = getattr(nsp, type(ind).is_a[0].name)(ind.name)
+                existing_iris.add(new_ind.iri)
                 mapping[ind] = new_ind
                 for cls in ind.is_a:
                     # Right now, we only support is_a entries that are either direct classes or a role restriction with
@@ -306,9 +309,10 @@ class Scene(owlready2.World):
                         new_ind.is_a.append(new_cls)
 
         # After copying all individuals, we copy the relations that were to_keep
+        to_keep_names = {str(x) for x in to_keep or []}
         for ind in mapping.keys():
             for var in ind.get_properties():
-                if str(var) in [str(x) for x in to_keep]:
+                if str(var) in to_keep_names:
                     vals = getattr(ind, var.python_name)
                     if not isinstance(vals, list):
                         vals = [vals]
@@ -371,11 +375,17 @@ class Scene(owlready2.World):
         Checks whether there is an accident in this scene, i.e., some non-zero height spatial objects intersect.
         :returns: True iff. an accident was detected in this scene.
         """
-        objs = list(self.search(type=self.get_ontology(auto.Ontology.Physics.value).Spatial_Object))
-        for i, obj1 in enumerate(objs):
-            for obj2 in objs[:i]:
-                if obj1.has_accident_with(obj2):
-                    return True
+        objs = [x for x in self.search(type=self.get_ontology(auto.Ontology.Physics.value).Spatial_Object)
+                if x.has_height and x.has_geometry()]
+        if len(objs) < 2:
+            return False
+        # Only pairs with intersecting bounding boxes can have an accident
+        bounds = numpy.array([x.get_geometry().bounds for x in objs])
+        candidates = (bounds[:, None, 0] <= bounds[None, :, 2]) & (bounds[None, :, 0] <= bounds[:, None, 2]) & \
+            (bounds[:, None, 1] <= bounds[None, :, 3]) & (bounds[None, :, 1] <= bounds[:, None, 3])
+        for i, j in zip(*numpy.nonzero(numpy.tril(candidates, k=-1))):
+            if objs[i].has_accident_with(objs[j]):
+                return True
         return False
 
     def individuals(self):
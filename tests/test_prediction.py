@@ -0,0 +1,46 @@
+import math
+
+import numpy
+import pytest
+
+from shapely import geometry, affinity
+
+from pyauto.extras.physics.dynamical_object import _roll_out
+
+
+def roll_out_step_by_step(geo, yaw: float, yaw_rate: float, speed: float, length: float, delta_t: float,
+                          steps: int) -> list:
+    """
+    Reference implementation of the prediction model that transforms the geometry step by step, where each step
+    rotates the geometry around the point `length` behind its current centroid and moves it along the new yaw.
+    """
+    geos = []
+    for _ in range(steps):
+        prev_yaw = yaw
+        yaw = prev_yaw + yaw_rate * delta_t
+        c = geo.centroid
+        center = (c.x - length * math.cos(math.radians(prev_yaw)), c.y - length * math.sin(math.radians(prev_yaw)))
+        geo = affinity.rotate(geo, angle=yaw - prev_yaw, origin=center)
+        geo = affinity.translate(geo, xoff=math.cos(math.radians(yaw)) * speed * delta_t,
+                                 yoff=math.sin(math.radians(yaw)) * speed * delta_t)
+        geos.append(geo)
+        yaw_rate *= 1 - (0.4 * delta_t)
+    return geos
+
+
+def get_coords(geo) -> numpy.ndarray:
+    return numpy.asarray(geo.exterior.coords if isinstance(geo, geometry.Polygon) else geo.coords)
+
+
+@pytest.mark.parametrize("yaw", [0, 37, 190, 300])
+@pytest.mark.parametrize("yaw_rate", [0, 5, 15, 40, -25])
+@pytest.mark.parametrize("geo, length", [(geometry.Polygon([(0, 0), (4.5, 0), (4.5, 1.8), (0, 1.8)]), 1.8),
+                                         (geometry.Point(3, 4), 0)])
+def test_roll_out_matches_step_by_step_model(geo, length, yaw, yaw_rate):
+    speed, delta_t, steps = 12, 0.25, 40
+    expected = roll_out_step_by_step(geo, yaw, yaw_rate, speed, length, delta_t, steps)
+    c = geo.centroid
+    matrices = _roll_out(c.x, c.y, yaw, yaw_rate, speed, length, delta_t, steps)
+    assert len(matrices) == steps
+    for e, matrix in zip(expected, matrices):
+        numpy.testing.assert_allclose(get_coords(affinity.affine_transform(geo, matrix)), get_coords(e), atol=1e-9)